@@ -438,38 +438,61 @@ def validate_channel_map(cm):
     :param cm:
     :return success, message:
     """
-    for ch in list(cm.keys()):
-        modes = list(cm[ch].keys())
-
+    for ch, modes in cm.items():
         if "default" not in modes:
             return False, f"'default' not present in channel '{ch:s}'"
 
-        for m in modes:
-            keys = list(cm[ch][m].keys())
+        for m, v in modes.items():
+            for k in ("picture_indices", "bit_indices"):
+                if k not in v:
+                    return False, f"'{k:s}' not present in channel '{ch:s}', mode '{m:s}'"
 
-            # check picture indices
-            if "picture_indices" not in keys:
-                return False, f"'picture_indices' not present in channel '{ch:s}', mode '{m:s}'"
+                inds = v[k]
+                if not isinstance(inds, (np.ndarray, list)):
+                    return False, f"'{k:s}' wrong type for channel '{ch:s}', mode '{m:s}'"
 
-            pi = cm[ch][m]["picture_indices"]
-            if not isinstance(pi, (np.ndarray, list)):
-                return False, f"'picture_indices' wrong type for channel '{ch:s}', mode '{m:s}'"
+                # ragged nested lists cannot be converted to an array, so np.ndim() raises an error
+                try:
+                    ndim = np.ndim(inds)
+                except ValueError:
+                    ndim = None
 
-            if isinstance(pi, np.ndarray) and pi.ndim != 1:
-                return False, f"'picture_indices' array with wrong dimension, '{ch:s}', mode '{m:s}'"
+                if ndim != 1:
+                    return False, f"'{k:s}' array with wrong dimension, '{ch:s}', mode '{m:s}'"
 
-            # check bit indices
-            if "bit_indices" not in keys:
-                return False, f"'bit_indices' not present in channel '{ch:s}', mode '{m:s}'"
+    return True, "array validated"
 
-            bi = cm[ch][m]["bit_indices"]
-            if not isinstance(bi, (np.ndarray, list)):
-                return False, f"'bit_indices' wrong type for channel '{ch:s}', mode '{m:s}'"
 
-            if isinstance(bi, np.ndarray) and bi.ndim != 1:
-                return False, f"'bit_indices' array with wrong dimension, '{ch:s}', mode '{m:s}'"
+def freeze_channel_map(cm):
+    """
+    Convert "picture_indices" and "bit_indices" entries of channel_map to read-only int16 arrays.
+    The input is not modified. channel_map should first be checked with validate_channel_map()
 
-    return True, "array validated"
+    :param cm:
+    :return cm_frozen:
+    """
+    cm_frozen = {}
+    for ch, modes in cm.items():
+        cm_frozen[ch] = {}
+        for m, v in modes.items():
+            cm_frozen[ch][m] = dict(v)
+            for k in ["picture_indices", "bit_indices"]:
+                # casting to int16 truncates floats and wraps out of range values silently, so check first
+                inds = np.asarray(v[k])
+                if inds.size != 0:
+                    if not np.issubdtype(inds.dtype, np.integer):
+                        raise ValueError(f"'{k:s}' must be integers for channel '{ch:s}', mode '{m:s}',"
+                                         f" but had dtype {inds.dtype}")
+
+                    if inds.min() < 0 or inds.max() > np.iinfo(np.int16).max:
+                        raise ValueError(f"'{k:s}' values must be in [0, {np.iinfo(np.int16).max:d}]"
+                                         f" for channel '{ch:s}', mode '{m:s}'")
+
+                arr = inds.astype(np.int16)
+                arr.setflags(write=False)
+                cm_frozen[ch][m][k] = arr
+
+    return cm_frozen
 
 
 def save_config_file(fname,
@@ -708,7 +731,10 @@ class dlp6500:
         :param product_id: product id, used to find DMD USB device
         :param bool debug: If True, will print output of commands.
         :param firmware_pattern_info:
-        :param presets: dictionary of presets
+        :param presets: dictionary of presets, presets[channel][mode] = {"picture_indices": ..., "bit_indices": ...}.
+          Presets passed directly must pass validate_channel_map(), so every channel must have a "default" mode,
+          and index entries must be 1D lists or arrays. Presets loaded from config_file were already validated by
+          load_config_file()
         :param config_file: either provide config file or provide firmware_pattern_info, presets, and firmware_patterns
         :param firmware_patterns: npatterns x ny x nx array of patterns stored in DMD firmware. NOTE, this class
           does not deal with loading or reading patterns from the firmware. Do this with the TI GUI
@@ -743,7 +769,8 @@ class dlp6500:
 
         # set firmware pattern info
         self.firmware_pattern_info = firmware_pattern_info
-        self.presets = presets
+        # presets loaded from config_file were already validated by load_config_file()
+        self._set_presets(presets, validate=config_file is None)
         self.firmware_patterns = firmware_patterns
 
         # on-the-fly patterns
@@ -767,6 +794,51 @@ class dlp6500:
     def initialize(self, **kwargs):
         self.__init__(initialize=True, **kwargs)
 
+    @property
+    def presets(self):
+        """
+        Dictionary of presets, presets[channel][mode] = {"picture_indices": ..., "bit_indices": ...}, where the
+        index arrays are read-only. To change the presets, assign a new dictionary to this attribute,
+        e.g. a modified copy.deepcopy(dmd.presets). Editing the nested dictionaries in place is not supported
+        """
+        return self._presets
+
+    @presets.setter
+    def presets(self, presets: dict):
+        self._set_presets(presets)
+
+    def _set_presets(self, presets: dict, validate: bool = True):
+        """
+        Store read-only copy of presets and build the lookups used by get_dmd_sequence()
+
+        :param presets:
+        :param validate: whether to check presets with validate_channel_map()
+        :return:
+        """
+        if presets is None:
+            presets = {}
+
+        if validate:
+            valid, error = validate_channel_map(presets)
+            if not valid:
+                raise ValueError(f"presets validation failed with error '{error:s}'")
+
+        self._presets = freeze_channel_map(presets)
+        # flat lookups used when generating pattern sequences
+        # (channel, mode) -> (picture_indices, bit_indices) and channel -> (off picture index, off bit index)
+        self._preset_map = {(c, m): (v["picture_indices"], v["bit_indices"])
+                            for c, modes in self._presets.items() for m, v in modes.items()}
+        # "off" modes must have exactly one pattern to be used. Others are stored as None and rejected when used
+        self._off_map = {}
+        for c, modes in self._presets.items():
+            if "off" in modes:
+                pi_off = modes["off"]["picture_indices"]
+                bi_off = modes["off"]["bit_indices"]
+                if pi_off.size == 1 and bi_off.size == 1:
+                    self._off_map[c] = (int(pi_off[0]), int(bi_off[0]))
+                else:
+                    self._off_map[c] = None
+
     # sending and receiving commands, operating system dependence
     def _get_device(self, vendor_id, product_id, dmd_index: int):
         """
@@ -1762,12 +1834,12 @@ class dlp6500:
         if isinstance(image_indices, int) or np.issubdtype(type(image_indices), np.integer):
             image_indices = [image_indices]
         elif isinstance(image_indices, np.ndarray):
-            image_indices = list(image_indices)
+            image_indices = image_indices.tolist()
 
         if isinstance(bit_indices, int) or np.issubdtype(type(bit_indices), np.integer):
             bit_indices = [bit_indices]
         elif isinstance(bit_indices, np.ndarray):
-            bit_indices = list(bit_indices)
+            bit_indices = bit_indices.tolist()
 
         if len(image_indices) != len(bit_indices):
             raise ValueError("image_indices and bit_indices must be the same length.")
@@ -1858,8 +1930,9 @@ class dlp6500:
         """
         Generate DMD patterns from a list of modes and channels
 
-        This function requires that self.presets exists. self.presets[channel][mode] are dictionaries with two keys,
-        "picture_indices" and "bit_indices"
+        self.presets[channel][mode] are read-only dictionaries with two keys, "picture_indices" and "bit_indices".
+        "off" patterns are taken from self.presets[channel]["off"], which must exist if noff_before, noff_after, or
+        blank are used for that channel
 
         :param modes: modes, which refers to the keys in self.presets[channel]
         :param channels: channels, which refer to the keys in self.presets
@@ -1871,9 +1944,6 @@ class dlp6500:
           of the patterns in self.presets[channel][mode] to use
         :return picture_indices, bit_indices:
         """
-        if self.presets is None:
-            raise ValueError("self.presets was None, but must be a dictionary populated with channels and modes.")
-
         # check channel argument
         if isinstance(channels, str):
             channels = [channels]
@@ -1896,11 +1966,15 @@ class dlp6500:
         if len(modes) != nmodes:
             raise ValueError(f"len(modes)={len(modes):d} and nmodes={nmodes:d}, but these must be equal")
 
+        for c, m in zip(channels, modes):
+            if (c, m) not in self._preset_map:
+                raise ValueError(f"mode '{m:s}' not present in channel '{c:s}' of self.presets")
+
         # check pattern indices argument
         if mode_pattern_indices is None:
             mode_pattern_indices = []
             for c, m in zip(channels, modes):
-                npatterns = len(self.presets[c][m]["picture_indices"])
+                npatterns = len(self._preset_map[(c, m)][0])
                 mode_pattern_indices.append(np.arange(npatterns, dtype=int))
 
         if isinstance(mode_pattern_indices, int):
@@ -1973,56 +2047,51 @@ class dlp6500:
             raise ValueError(f"len(blank)={len(blank):d} and nmodes={nmodes:d}, but these must be equal")
 
         # processing
+        # select indices. Presets are read-only, and indexing returns a new array, so no copy is needed
         pic_inds = []
         bit_inds = []
-        for c, m, ind, nreps in zip(channels, modes, mode_pattern_indices, nrepeats):
-            # need np.array(..., copy=True) to don't get references in arrays
-            pi = np.array(np.atleast_1d(self.presets[c][m]["picture_indices"]), copy=True)
-            bi = np.array(np.atleast_1d(self.presets[c][m]["bit_indices"]), copy=True)
-            # select indices
-            pi = pi[ind]
-            bi = bi[ind]
-            # repeats
-            pi = np.hstack([pi] * nreps)
-            bi = np.hstack([bi] * nreps)
-
-            pic_inds.append(pi)
-            bit_inds.append(bi)
-
-        # insert off patterns at the start or end of the sequence
+        for c, m, ind in zip(channels, modes, mode_pattern_indices):
+            pi_src, bi_src = self._preset_map[(c, m)]
+            pic_inds.append(pi_src[ind])
+            bit_inds.append(bi_src[ind])
+
+        # number of patterns in each mode, including "off" patterns. If blanking, every pattern is followed by "off"
+        steps = [2 if bl else 1 for bl in blank]
+        npatterns = [nb + nreps * pi.size + na for pi, nreps, nb, na in
+                     zip(pic_inds, nrepeats, noff_before, noff_after)]
+
+        # allocate output once and write each mode into its slice
+        ntotal = sum(st * n for st, n in zip(steps, npatterns))
+        pic_out = np.empty(ntotal, dtype=np.int16)
+        bit_out = np.empty(ntotal, dtype=np.int16)
+
+        start = 0
         for ii in range(nmodes):
-            if noff_before[ii] != 0 or noff_after[ii] != 0:
-                ipic_off_before = self.presets[channels[ii]]["off"]["picture_indices"] * np.ones(noff_before[ii], dtype=int)
-                ibit_off_before = self.presets[channels[ii]]["off"]["bit_indices"] * np.ones(noff_before[ii], dtype=int)
-
-                ipic_off_after = self.presets[channels[ii]]["off"]["picture_indices"] * np.ones(noff_after[ii], dtype=int)
-                ibit_off_after = self.presets[channels[ii]]["off"]["bit_indices"] * np.ones(noff_after[ii], dtype=int)
+            stop = start + steps[ii] * npatterns[ii]
 
-                pic_inds[ii] = np.concatenate((ipic_off_before, pic_inds[ii], ipic_off_after), axis=0).astype(int)
-                bit_inds[ii] = np.concatenate((ibit_off_before, bit_inds[ii], ibit_off_after), axis=0).astype(int)
-
-        # insert off patterns after each pattern to "blank"
-        for ii in range(nmodes):
-            if blank[ii]:
-                npatterns = len(pic_inds[ii])
-                ipic_off = self.presets[channels[ii]]["off"]["picture_indices"]
-                ibit_off = self.presets[channels[ii]]["off"]["bit_indices"]
+            # fill "off" patterns before/after and between patterns
+            if noff_before[ii] != 0 or noff_after[ii] != 0 or blank[ii]:
+                if channels[ii] not in self._off_map:
+                    raise ValueError(f"'off' mode not present in channel '{channels[ii]:s}', but is required"
+                                     f" for noff_before, noff_after, or blank")
 
-                ipic_new = np.zeros((2 * npatterns), dtype=int)
-                ipic_new[::2] = pic_inds[ii]
-                ipic_new[1::2] = ipic_off
+                if self._off_map[channels[ii]] is None:
+                    raise ValueError(f"'off' mode in channel '{channels[ii]:s}' must have exactly one picture index"
+                                     f" and one bit index")
 
-                ibit_new = np.zeros((2 * npatterns), dtype=int)
-                ibit_new[::2] = bit_inds[ii]
-                ibit_new[1::2] = ibit_off
+                ipic_off, ibit_off = self._off_map[channels[ii]]
+                pic_out[start:stop] = ipic_off
+                bit_out[start:stop] = ibit_off
 
-                pic_inds[ii] = ipic_new
-                bit_inds[ii] = ibit_new
+            # repeats
+            pstart = start + steps[ii] * noff_before[ii]
+            pstop = stop - steps[ii] * noff_after[ii]
+            pic_out[pstart:pstop:steps[ii]] = np.tile(pic_inds[ii], nrepeats[ii])
+            bit_out[pstart:pstop:steps[ii]] = np.tile(bit_inds[ii], nrepeats[ii])
 
-        pic_inds = np.hstack(pic_inds)
-        bit_inds = np.hstack(bit_inds)
+            start = stop
 
-        return pic_inds, bit_inds
+        return pic_out, bit_out
 
     def program_dmd_seq(self,
                         modes: list[str],
@@ -2267,16 +2336,19 @@ if __name__ == "__main__":
     use_dummy = False
 
     if use_dummy:
-        dmd = dlp6500dummy(firmware_pattern_info=pattern_data, presets=presets)
+        dmd = dlp6500dummy(firmware_pattern_info=pattern_data)
     else:
         # detect system
         if sys.platform == "win32":
-            dmd = dlp6500win(firmware_pattern_info=pattern_data, presets=presets)
+            dmd = dlp6500win(firmware_pattern_info=pattern_data)
         elif sys.platform == "linux":
-            dmd = dlp6500ix(firmware_pattern_info=pattern_data, presets=presets)
+            dmd = dlp6500ix(firmware_pattern_info=pattern_data)
         else:
             raise NotImplementedError(f"platform was '{sys.platform:s}' but must be 'win32' or 'linux'")
 
+    # presets were already validated by load_config_file()
+    dmd._set_presets(presets, validate=False)
+
     pic_inds, bit_inds = dmd.program_dmd_seq(args.modes, args.channels,
                                              nrepeats=args.nrepeats,
                                              noff_before=args.noff_before,
@@ -79,12 +79,10 @@ else:
     fractions = [0.97]
     n_thetas = len(fractions)
 
-    xoffs = np.zeros((n_thetas, n_phis))
-    yoffs = np.zeros((n_thetas, n_phis))
-    for ii in range(n_thetas):
-        for jj in range(n_phis):
-            xoffs[ii, jj] = np.cos(phis[jj]) * pupil_rad_mirrors * fractions[ii]
-            yoffs[ii, jj] = np.sin(phis[jj]) * pupil_rad_mirrors * fractions[ii]
+    # n_thetas x n_phis
+    rads = pupil_rad_mirrors * np.array(fractions)
+    xoffs = rads[:, None] * np.cos(phis)[None, :]
+    yoffs = rads[:, None] * np.sin(phis)[None, :]
 
     add_zero = True
     if add_zero:
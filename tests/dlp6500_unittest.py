@@ -0,0 +1,188 @@
+import unittest
+from unittest import mock
+import copy
+import tempfile
+from pathlib import Path
+import numpy as np
+
+# dlp6500 imports pywinusb, which is only available on Windows
+try:
+    import mcsim.expt_ctrl.dlp6500 as dlp6500
+    dlp6500_available = True
+except ImportError:
+    dlp6500_available = False
+
+
+@unittest.skipUnless(dlp6500_available, "dlp6500 could not be imported")
+class TestDmdSequence(unittest.TestCase):
+
+    def setUp(self):
+        presets = {"blue": {"default": {"picture_indices": [0, 0, 0],
+                                        "bit_indices": [0, 1, 2]},
+                            "off": {"picture_indices": [1],
+                                    "bit_indices": [3]}
+                            },
+                   "red": {"default": {"picture_indices": [2, 2],
+                                       "bit_indices": [4, 5]},
+                           "off": {"picture_indices": [3],
+                                   "bit_indices": [6]}
+                           },
+                   "green": {"default": {"picture_indices": [4],
+                                         "bit_indices": [7]}
+                             }
+                   }
+
+        self.dmd = dlp6500.dlp6500dummy(presets=presets, initialize=False)
+
+    def check_sequence(self, pic_inds, bit_inds, pic_inds_expected, bit_inds_expected):
+        np.testing.assert_equal(pic_inds, np.array(pic_inds_expected))
+        np.testing.assert_equal(bit_inds, np.array(bit_inds_expected))
+
+    def test_repeats(self):
+        pic_inds, bit_inds = self.dmd.get_dmd_sequence("default", "blue", nrepeats=2)
+        self.check_sequence(pic_inds, bit_inds, [0, 0, 0, 0, 0, 0], [0, 1, 2, 0, 1, 2])
+
+    def test_noff(self):
+        pic_inds, bit_inds = self.dmd.get_dmd_sequence("default", "blue", noff_before=2, noff_after=1)
+        self.check_sequence(pic_inds, bit_inds, [1, 1, 0, 0, 0, 1], [3, 3, 0, 1, 2, 3])
+
+    def test_blank(self):
+        pic_inds, bit_inds = self.dmd.get_dmd_sequence("default", "blue", blank=True)
+        self.check_sequence(pic_inds, bit_inds, [0, 1, 0, 1, 0, 1], [0, 3, 1, 3, 2, 3])
+
+    def test_blank_noff_repeats_indices(self):
+        """
+        off patterns before and after the mode are also followed by a blanking off pattern
+        """
+        pic_inds, bit_inds = self.dmd.get_dmd_sequence("default", "blue",
+                                                       nrepeats=2,
+                                                       noff_before=1,
+                                                       noff_after=1,
+                                                       blank=True,
+                                                       mode_pattern_indices=[[2]])
+        self.check_sequence(pic_inds, bit_inds, [1, 1, 0, 1, 0, 1, 1, 1], [3, 3, 2, 3, 2, 3, 3, 3])
+
+    def test_multiple_channels(self):
+        pic_inds, bit_inds = self.dmd.get_dmd_sequence("default", ["blue", "red"],
+                                                       nrepeats=[1, 2],
+                                                       noff_before=[1, 0],
+                                                       noff_after=[0, 1],
+                                                       blank=[False, True],
+                                                       mode_pattern_indices=[[0, 2], [1]])
+        self.check_sequence(pic_inds, bit_inds,
+                            [1, 0, 0, 2, 3, 2, 3, 3, 3],
+                            [3, 0, 2, 5, 6, 5, 6, 6, 6])
+
+    def test_multiple_channels_no_off(self):
+        pic_inds, bit_inds = self.dmd.get_dmd_sequence(["default", "default", "default"],
+                                                       ["red", "green", "blue"],
+                                                       mode_pattern_indices=[[1, 0], [0], [1]])
+        self.check_sequence(pic_inds, bit_inds, [2, 2, 4, 0], [5, 4, 7, 1])
+
+    def test_missing_off(self):
+        with self.assertRaises(ValueError):
+            self.dmd.get_dmd_sequence("default", "green", blank=True)
+
+    def test_missing_mode(self):
+        with self.assertRaises(ValueError):
+            self.dmd.get_dmd_sequence("sim", "blue")
+
+    def test_dtype(self):
+        pic_inds, bit_inds = self.dmd.get_dmd_sequence("default", ["blue", "red"], blank=True)
+        self.assertEqual(pic_inds.dtype, np.int16)
+        self.assertEqual(bit_inds.dtype, np.int16)
+
+
+@unittest.skipUnless(dlp6500_available, "dlp6500 could not be imported")
+class TestPresets(unittest.TestCase):
+
+    def setUp(self):
+        self.presets = {"blue": {"default": {"picture_indices": [0, 0],
+                                             "bit_indices": [0, 1]},
+                                 "off": {"picture_indices": [1],
+                                         "bit_indices": [3]}
+                                 }
+                        }
+
+    def test_presets_setter(self):
+        """
+        assigning new presets must update the patterns used by get_dmd_sequence()
+        """
+        dmd = dlp6500.dlp6500dummy(presets=self.presets, initialize=False)
+
+        presets_new = copy.deepcopy(dmd.presets)
+        presets_new["blue"]["sim"] = {"picture_indices": [2], "bit_indices": [5]}
+        dmd.presets = presets_new
+
+        pic_inds, bit_inds = dmd.get_dmd_sequence("sim", "blue", blank=True)
+        np.testing.assert_equal(pic_inds, np.array([2, 1]))
+        np.testing.assert_equal(bit_inds, np.array([5, 3]))
+
+    def test_presets_read_only(self):
+        dmd = dlp6500.dlp6500dummy(presets=self.presets, initialize=False)
+
+        with self.assertRaises(ValueError):
+            dmd.presets["blue"]["default"]["picture_indices"][0] = 5
+
+        # input presets are not modified
+        self.assertIsInstance(self.presets["blue"]["default"]["picture_indices"], list)
+
+    def test_presets_out_of_range(self):
+        for inds in [[40000], [-1], [1.9]]:
+            self.presets["blue"]["default"]["bit_indices"] = inds
+            with self.assertRaises(ValueError):
+                dlp6500.dlp6500dummy(presets=self.presets, initialize=False)
+
+    def test_presets_require_default(self):
+        del self.presets["blue"]["default"]
+
+        with self.assertRaises(ValueError):
+            dlp6500.dlp6500dummy(presets=self.presets, initialize=False)
+
+        dmd = dlp6500.dlp6500dummy(initialize=False)
+        with self.assertRaises(ValueError):
+            dmd.presets = self.presets
+
+    def test_presets_wrong_dimension(self):
+        for inds in [[[0, 1], [2, 3]], [[0, 1], [2]], np.zeros((2, 2), dtype=int)]:
+            self.presets["blue"]["default"]["picture_indices"] = inds
+            valid, _ = dlp6500.validate_channel_map(self.presets)
+            self.assertFalse(valid)
+
+            with self.assertRaises(ValueError):
+                dlp6500.dlp6500dummy(presets=self.presets, initialize=False)
+
+    def test_malformed_off(self):
+        """
+        'off' modes without exactly one pattern are only rejected when they are used
+        """
+        for inds in [[], [1, 2]]:
+            self.presets["blue"]["off"] = {"picture_indices": inds, "bit_indices": inds}
+            dmd = dlp6500.dlp6500dummy(presets=self.presets, initialize=False)
+
+            pic_inds, bit_inds = dmd.get_dmd_sequence("default", "blue")
+            np.testing.assert_equal(pic_inds, np.array([0, 0]))
+            np.testing.assert_equal(bit_inds, np.array([0, 1]))
+
+            with self.assertRaises(ValueError):
+                dmd.get_dmd_sequence("default", "blue", blank=True)
+
+    def test_config_file_validated_once(self):
+        with tempfile.TemporaryDirectory() as save_dir:
+            fname = Path(save_dir) / "dmd_config.json"
+            dlp6500.save_config_file(fname, [], channel_map=self.presets, use_zarr=False)
+
+            with mock.patch.object(dlp6500, "validate_channel_map",
+                                   wraps=dlp6500.validate_channel_map) as validate:
+                dmd = dlp6500.dlp6500dummy(config_file=fname, initialize=False)
+
+            # only validated by load_config_file()
+            self.assertEqual(validate.call_count, 1)
+
+        pic_inds, bit_inds = dmd.get_dmd_sequence("default", "blue", noff_after=1)
+        np.testing.assert_equal(pic_inds, np.array([0, 0, 1]))
+        np.testing.assert_equal(bit_inds, np.array([0, 1, 3]))
+
+
+if __name__ == "__main__":
+    unittest.main()